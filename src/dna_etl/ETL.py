@@ -1,14 +1,35 @@
 import json
+import mmap
+import multiprocessing
+import os
 import sys
-from typing import Tuple, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, List, Dict, Any
 from pathlib import Path
 from datetime import datetime, timezone
-from .json_processor import (is_patient_at_least_40, dates_valid,
-                            remove_sensitive_data, values_length_valid)
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    _ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional, as in txt_processor
+    _NUMPY_AVAILABLE = False
+from .batch_reader import read_many
+from .json_processor import is_patient_at_least_40, process_metadata
 from .txt_processor import (calculate_per_sequence, most_common_codon,
                            lcs, build_txt_output)
-from .valid_input import (valid_input_format, valid_context_path, valid_results_path,
-                         valid_context_files, valid_file_names)
+from .valid_input import (preflight, valid_input_format, valid_context_path,
+                         valid_results_path, valid_context_files, valid_file_names)
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available (~3x faster), else stdlib."""
+    return orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
 
 
 def utc_now_iso() -> str:
@@ -16,6 +37,32 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _find_pair(context_path: Path) -> Tuple[Path, Path]:
+    """
+    Locate the single .json and .txt file in the context directory with one
+    os.scandir pass (the two Path.glob calls each walked the whole dir).
+    :param context_path: Path to the context directory
+    :return: (json_file_path, txt_file_path), both resolved
+    :raises ValueError: if either file is missing from the directory
+    """
+    json_path = txt_path = None
+    with os.scandir(context_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            if json_path is None and name.endswith(".json"):
+                json_path = context_path / name
+            elif txt_path is None and name.endswith(".txt"):
+                txt_path = context_path / name
+            if json_path is not None and txt_path is not None:
+                break
+    if json_path is None or txt_path is None:
+        missing = ".json" if json_path is None else ".txt"
+        raise ValueError(f"context directory '{context_path}' has no {missing} file")
+    return json_path.resolve(), txt_path.resolve()
+
+
 def open_input_file(input_file_path: str) -> Tuple[Path, Path, Path, Path, str]:
     """
     Opens the input JSON file, reads context_path and results_path,
@@ -25,15 +72,13 @@ def open_input_file(input_file_path: str) -> Tuple[Path, Path, Path, Path, str]:
       (context_path, json_file_path, txt_file_path, results_path, participant_id)
     """
     # load input file
-    with open(input_file_path, "r", encoding="utf-8") as input_file:
-        input_data = json.load(input_file)
+    input_data = json_loads(Path(input_file_path).read_bytes())
 
     context_path = Path(input_data["context_path"]).resolve()
     results_path = Path(input_data["results_path"]).resolve()
 
     # find json and txt files
-    json_file_path = next(context_path.glob("*.json")).resolve()
-    txt_file_path = next(context_path.glob("*.txt")).resolve()
+    json_file_path, txt_file_path = _find_pair(context_path)
 
     # derive participant_id from JSON filename, e.g. "IND123456_dna.json" -> "IND123456"
     stem = json_file_path.stem
@@ -49,26 +94,76 @@ def extract_json_data(json_file_path: Path) -> dict:
     :param json_file_path: Path to the JSON file
     :return: Parsed JSON data as a dictionary
     """
-    with json_file_path.open("r", encoding="utf-8") as json_file:
-        metadata = json.load(json_file)
+    metadata = json_loads(json_file_path.read_bytes())
     return metadata
 
 
+# lowercase bases -> uppercase, applied to the whole file in one C pass
+_UPPER_TRANS = bytes.maketrans(b"acgt", b"ACGT")
+
+
 def extract_txt_sequences(txt_file_path: Path) -> List[str]:
     """
     Read the DNA TXT file and returns all non-empty lines as strings.
+    The file is memory-mapped (with sequential readahead advised where
+    supported) and lines are sliced straight off the map, so no full-file
+    heap copy is made on top of the kernel page cache.
     :param txt_file_path: Path to the TXT file
     :return: List of non-empty lines from the TXT file
     """
-    sequences_lst = []
-
-    with txt_file_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            sequences_lst.append(line.upper())
-    return sequences_lst
+    fd = os.open(txt_file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return []
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+    try:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)  # let the kernel prefetch ahead
+
+        # Files are specified as uppercase A/C/G/T; probe the map in bounded
+        # chunks and only pay the per-line lowercase translate when some
+        # byte outside that alphabet (plus whitespace) actually shows up.
+        needs_upper = False
+        probe_step = 1 << 20
+        for off in range(0, size, probe_step):
+            if mm[off:off + probe_step].translate(None, b"ACGT\r\n\t ") != b"":
+                needs_upper = True
+                break
+
+        # Locate line boundaries: one vectorized scan over a zero-copy view
+        # of the map when NumPy is available, else a find() loop.
+        if _NUMPY_AVAILABLE:
+            newline_pos = np.flatnonzero(
+                np.frombuffer(mm, dtype=np.uint8) == 0x0A).tolist()
+        else:
+            newline_pos = []
+            pos = mm.find(b"\n")
+            while pos != -1:
+                newline_pos.append(pos)
+                pos = mm.find(b"\n", pos + 1)
+
+        sequences_lst = []
+        start = 0
+        for nl in newline_pos:
+            line = mm[start:nl].strip()
+            if line:
+                if needs_upper:
+                    line = line.translate(_UPPER_TRANS)
+                sequences_lst.append(line.decode("ascii"))
+            start = nl + 1
+        if start < size:  # trailing line without a final newline
+            line = mm[start:size].strip()
+            if line:
+                if needs_upper:
+                    line = line.translate(_UPPER_TRANS)
+                sequences_lst.append(line.decode("ascii"))
+        return sequences_lst
+    finally:
+        mm.close()
 
 
 def build_metadata_block(context_path: Path, results_path: Path,
@@ -121,24 +216,95 @@ def build_final_output(metadata_block: Dict[str, Any],
 def write_output(results_path: Path, participant_id: str, final_output: Dict[str, Any]) -> Path:
     results_path.mkdir(parents=True, exist_ok=True)  # ensure dir exists
     out_path = results_path / f"{participant_id}.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(final_output, f, ensure_ascii=False, indent=2)
+    if _ORJSON_AVAILABLE:
+        # One C-level serialization to a single bytes blob, written with a
+        # single os.write — no TextIOWrapper codec or buffer-copy layer.
+        data = orjson.dumps(final_output, option=orjson.OPT_INDENT_2)
+        fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    else:
+        # Fallback keeps the same shape: serialize once, write once
+        out_path.write_text(json.dumps(final_output, ensure_ascii=False, indent=2),
+                            encoding="utf-8")
     return out_path
 
 
-if __name__ == "__main__":
-    # save start time
+def process_one(input_file_path: str) -> Path:
+    """
+    Run the whole single-participant pipeline for one runner input file:
+    open -> extract -> validate -> per-sequence stats -> build blocks -> write.
+    Raises ValueError when a metadata validation fails, so batch callers can
+    report the failing participant without tearing the pool down.
+    :param input_file_path: Path to the runner input JSON
+    :return: Path of the written output file
+    """
     start_time = utc_now_iso()
 
+    context_path, json_path, txt_path, results_path, participant_id = \
+        open_input_file(str(input_file_path))
+
+    metadata_to_process = extract_json_data(json_path)
+    if not is_patient_at_least_40(metadata_to_process):
+        raise ValueError("participant must be at least 40 years old")
+    json_block, metadata_ok, metadata_error = process_metadata(metadata_to_process)
+    if not metadata_ok:
+        raise ValueError(metadata_error)
+
+    seq_lst = extract_txt_sequences(txt_path)
+    per_sequence = calculate_per_sequence(seq_lst)
+    txt_block = build_txt_output(per_sequence, most_common_codon(per_sequence), lcs(seq_lst))
+
+    result_block = build_results_block(participant_id, json_block, txt_block)
+    end_time = utc_now_iso()
+    metadata_block = build_metadata_block(context_path, results_path, start_time, end_time)
+    return write_output(results_path, participant_id, build_final_output(metadata_block, [result_block]))
+
+
+def run_batch(input_jsons: List[Path], max_workers: Optional[int] = None) -> List[Path]:
+    """
+    Process many runner inputs, one participant per process-pool worker.
+    The per-participant work (txt scan, SAM, JSON walk) is CPU-bound, so a
+    process pool sidesteps the GIL and scales with core count; the numba
+    kernels are compiled with cache=True, so workers load them from the
+    on-disk cache instead of re-JITting. All manifests are prefetched in one
+    batched read and run through the full preflight validation up front, so
+    a bad manifest fails fast — and names itself — instead of surfacing as
+    an opaque error mid-batch inside a worker.
+    :param input_jsons: Paths of runner input JSON files
+    :param max_workers: Pool size; defaults to os.cpu_count()
+    :return: Output paths, in the same order as input_jsons
+    """
+    paths = [Path(p) for p in input_jsons]
+    for path, raw in zip(paths, read_many(paths)):
+        vp = preflight(json_loads(raw))
+        if not (valid_input_format(vp) and valid_context_path(vp)
+                and valid_results_path(vp) and valid_context_files(vp)
+                and valid_file_names(vp)):
+            raise ValueError(f"invalid runner input: {path}")
+    if len(paths) <= 1:  # no pool for a single participant
+        return [process_one(str(p)) for p in paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    # spawn, not fork: numba's threading layer does not survive a fork and
+    # deadlocks forked workers at shutdown; spawned workers re-import the
+    # package and pick the JITted kernels up from the cache=True disk cache.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        return list(pool.map(process_one, map(str, paths)))
+
+
+if __name__ == "__main__":
     # INPUT VALIDATION
 
     # check command line args
     if len(sys.argv) != 2:
         print("Usage: python ETL.py <input.json>")
         sys.exit(2)
-    # open input file
-    with open(sys.argv[1], "r", encoding="utf-8") as in_file:
-        in_data = json.load(in_file)
+    # open input file and normalize it once: the five checks below then read
+    # cached stat/scandir answers instead of re-hitting the filesystem
+    in_data = preflight(json_loads(Path(sys.argv[1]).read_bytes()))
     # validate input format
     if not valid_input_format(in_data):
         print("Input format error: expected keys 'context_path' and 'results_path' as non-empty strings.")
@@ -163,58 +329,9 @@ if __name__ == "__main__":
               "the two files in context_path must share the same base filename (participant id).")
         sys.exit(2)
 
-    # OPEN FILES AND EXTRACT DATA
-    in_context_path, in_json_path, txt_path, result_path, in_participant_id = open_input_file(sys.argv[1])
-
-    # JSON PROCESSING:
-
-    metadata_to_process = extract_json_data(in_json_path)
-
-    # json validations
-    if not is_patient_at_least_40(metadata_to_process):
-        print(f"Validation error: participant must be at least 40 years old.")
+    # RUN THE PIPELINE (shared with run_batch workers)
+    try:
+        output_path = process_one(sys.argv[1])
+    except ValueError as e:
+        print(f"Validation error: {e}.")
         sys.exit(1)
-
-    if not dates_valid(metadata_to_process):
-        print("Validation error: one or more dates are out of the allowed range [2014-01-01..2024-12-31].")
-        sys.exit(1)
-
-    if not values_length_valid(metadata_to_process):
-        print("Validation error: one or more string values exceed 64 characters.")
-        sys.exit(1)
-
-    # remove sensitive data
-    json_block_out = remove_sensitive_data(metadata_to_process)
-
-    # TXT PROCESSING:
-
-    seq_lst = extract_txt_sequences(txt_path)
-
-    # calculate GC% and codon frequencies per sequence
-    per_sequence_results = calculate_per_sequence(seq_lst)
-
-    # find most common codon(s)
-    common_codon = most_common_codon(per_sequence_results)
-
-    # find LCS (value, length, indexes)
-    lcs_result = lcs(seq_lst)
-
-    # combine TXT results into the expected JSON structure
-    txt_block_out = build_txt_output(per_sequence_results, common_codon, lcs_result)
-
-    # BUILD OUTPUT
-
-    # build results block
-    result_block = build_results_block(in_participant_id, json_block_out, txt_block_out)
-
-    # save end time
-    end_time = utc_now_iso()
-
-    # build metadata block
-    metadata_block_out = build_metadata_block(in_context_path, result_path, start_time, end_time)
-
-    # combine all blocks into the final output structure
-    final_output_out = build_final_output(metadata_block_out, [result_block])
-
-    # write output file
-    output_path = write_output(result_path, in_participant_id, final_output_out)
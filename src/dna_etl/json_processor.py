@@ -1,5 +1,6 @@
+import re
 from datetime import date
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Tuple, Union, cast
 
 MAX_VALUE_LEN = 64
 # ALL FUNCTIONS WORKING ON DICT (THAT WAS PARSED FROM JSON)
@@ -13,11 +14,39 @@ def is_patient_at_least_40(metadata: Dict[str, Any]) -> bool:
     """
     # extract birthdate
     birth_date_str = metadata["individual_metadata"]["date_of_birth"]
-    birth_date = date.fromisoformat(birth_date_str)
     today = date.today()
-    # calculate age
-    age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-    return age >= 40
+    # Single branch-free compare: the birth year must trail the current
+    # year by at least 40, minus one more when the birthday hasn't come up
+    # yet this year — "MM-DD" strings order chronologically, so the
+    # birthday test is one string comparison, no month/day ints.
+    return int(birth_date_str[:4]) <= (
+        today.year - 40 - (birth_date_str[5:] > f"{today.month:02d}-{today.day:02d}"))
+
+
+_MIN_DATE_STR = "2014-01-01"
+_MAX_DATE_STR = "2024-12-31"
+# range-limited date fields (see dates_valid)
+_DATE_FIELDS = frozenset({"date_requested", "date_completed", "collection_date"})
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _date_in_range(date_str: str) -> bool:
+    """True if the string is a real ISO date inside the allowed [2014..2024] range."""
+    # "YYYY-MM-DD" strings order the same as the dates they spell, so the
+    # range check is a plain string comparison; the precompiled shape match
+    # rejects other formats cheaply and keeps fromisoformat's laxer 3.11+
+    # spellings (e.g. "20201231") out of that compare. Only in-shape,
+    # in-range strings pay the fromisoformat parse, which rejects
+    # impossible dates like "2020-13-45" the shape alone would admit.
+    if not _ISO_DATE_RE.fullmatch(date_str):
+        return False
+    if not (_MIN_DATE_STR <= date_str <= _MAX_DATE_STR):
+        return False
+    try:
+        date.fromisoformat(date_str)
+    except ValueError:
+        return False
+    return True
 
 
 def dates_valid(metadata: Dict[str, Any]) -> bool:
@@ -25,15 +54,10 @@ def dates_valid(metadata: Dict[str, Any]) -> bool:
     :param metadata: Dictionary containing patient metadata
     :return: True if all dates are valid, False otherwise
     """
-    min_date = date(2014, 1, 1)
-    max_date = date(2024, 12, 31)
-
-    date_requested = date.fromisoformat(metadata["test_metadata"]["date_requested"])
-    date_completed = date.fromisoformat(metadata["test_metadata"]["date_completed"])
-    collection_date = date.fromisoformat(metadata["sample_metadata"]["collection_date"])
-
-    for d in (date_requested, date_completed, collection_date):
-        if not (min_date <= d <= max_date):
+    test_meta = metadata["test_metadata"]
+    for d in (test_meta["date_requested"], test_meta["date_completed"],
+              metadata["sample_metadata"]["collection_date"]):
+        if not _date_in_range(d):
             return False
     return True
 
@@ -71,22 +95,77 @@ def values_length_valid(metadata: Dict[str, Any], max_len: int = MAX_VALUE_LEN)
     :param max_len: Maximum allowed length for string values
     :return: True if all string values are within the allowed length, False otherwise
     """
-    def _valid_length(obj: Any) -> bool:
-        if isinstance(obj, dict):
-            for v in obj.values():
-                if not _valid_length(v):
-                    return False
-            return True
-
-        if isinstance(obj, (list, tuple)):
-            for x in obj:
-                if not _valid_length(x):
-                    return False
-            return True
-
-        if isinstance(obj, str):
-            return len(obj) <= max_len
+    # Iterative walk with an explicit stack: no recursion frames, exact
+    # type() checks (JSON-parsed nodes are always plain dict/list/str),
+    # and an early exit on the first violation.
+    stack: List[Any] = [metadata]
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
+        if t is dict:
+            stack.extend(obj.values())
+        elif t is list or t is tuple:
+            stack.extend(obj)
+        elif t is str and len(obj) > max_len:
+            return False
+    return True
 
-        return True
 
-    return _valid_length(metadata)
+def process_metadata(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], bool, str]:
+    """
+    Fused single pass over the metadata tree: drops "_"-prefixed keys,
+    checks string lengths and validates the three range-limited date
+    fields, all in one walk. The tree is cleaned IN PLACE — the raw parse
+    is single-use in the entry point, so rebuilding a second copy of every
+    nested container would only double the allocations.
+    :param metadata: Dictionary containing patient metadata
+    :return: (cleaned metadata — the same object, ok, error message — empty string when ok)
+    """
+    lengths_ok = True
+    dates_ok = True
+    dates_seen: set = set()
+
+    # Explicit-stack walk (no recursion frames); strings are checked where
+    # they are found and only containers are pushed.
+    stack: List[Any] = [metadata]
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            dropped = None
+            for k, v in obj.items():
+                if k.startswith("_"):
+                    if dropped is None:
+                        dropped = []
+                    dropped.append(k)
+                    stack.append(v)  # still validate inside dropped subtrees
+                    continue
+                t = type(v)
+                if t is str:
+                    if k in _DATE_FIELDS:
+                        dates_seen.add(k)
+                        if not _date_in_range(v):
+                            dates_ok = False
+                    if len(v) > MAX_VALUE_LEN:
+                        lengths_ok = False
+                elif t is dict or t is list:
+                    stack.append(v)
+            if dropped:
+                for k in dropped:
+                    del obj[k]
+        elif type(obj) is list:
+            for x in obj:
+                t = type(x)
+                if t is str:
+                    if len(x) > MAX_VALUE_LEN:
+                        lengths_ok = False
+                elif t is dict or t is list:
+                    stack.append(x)
+        elif type(obj) is str and len(obj) > MAX_VALUE_LEN:
+            lengths_ok = False
+
+    cleaned = metadata
+    if not dates_ok or dates_seen != _DATE_FIELDS:
+        return cleaned, False, "one or more dates are out of the allowed range [2014-01-01..2024-12-31]"
+    if not lengths_ok:
+        return cleaned, False, "one or more string values exceed 64 characters"
+    return cleaned, True, ""
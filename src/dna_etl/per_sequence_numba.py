@@ -0,0 +1,81 @@
+"""
+Optional Numba-accelerated kernel for txt_processor.calculate_per_sequence.
+
+When numba (and numpy) are installed, the kernels walk the raw ASCII bytes
+of a sequence once, encoding each base to its 2-bit code (A=0, C=1, G=2,
+T=3) inline and accumulating the GC count and a 64-slot codon histogram in
+the same pass — no Python objects and no pre-encoded temp arrays. Callers
+must check _NUMBA_AVAILABLE before using the kernels; without numba this
+module only exposes the flag and the plain-Python paths in txt_processor
+are used.
+"""
+try:
+    import numpy as np
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    # ASCII byte -> 2-bit base code; read inside the kernels so encoding
+    # fuses into the scan instead of materializing a coded copy per sequence
+    _BYTE_CODE = np.zeros(256, dtype=np.uint8)
+    _BYTE_CODE[[ord("A"), ord("C"), ord("G"), ord("T")]] = [0, 1, 2, 3]
+
+    @njit(cache=True)
+    def scan_encoded(raw):
+        """
+        Single fused pass over one sequence's raw ASCII bytes.
+        :param raw: uint8 array of A/C/G/T byte values
+        :return: (gc_count, hist) where hist is a 64-slot int64 codon histogram
+        """
+        n = raw.shape[0]
+        hist = np.zeros(64, dtype=np.int64)
+        gc = 0
+        full = n - n % 3
+        for i in range(0, full, 3):
+            c0 = _BYTE_CODE[raw[i]]
+            c1 = _BYTE_CODE[raw[i + 1]]
+            c2 = _BYTE_CODE[raw[i + 2]]
+            hist[(c0 << 4) | (c1 << 2) | c2] += 1
+            gc += (c0 == 1) + (c0 == 2) + (c1 == 1) + (c1 == 2) + (c2 == 1) + (c2 == 2)
+        # trailing 1-2 bases contribute to GC but not to any codon
+        for i in range(full, n):
+            c = _BYTE_CODE[raw[i]]
+            gc += (c == 1) + (c == 2)
+        return gc, hist
+
+    @njit(cache=True, parallel=True)
+    def scan_batch(raw, offsets, gc_out, hist_out):
+        """
+        Batch variant of scan_encoded: sequences are packed into one flat
+        byte buffer with offsets[s]..offsets[s+1] delimiting sequence s.
+        Each sequence is independent, so the outer loop runs in parallel
+        across cores; every iteration writes only its own output row.
+        :param raw: uint8 flat buffer of A/C/G/T byte values for all sequences
+        :param offsets: int64 array of length n_sequences + 1
+        :param gc_out: int64 output array (GC count per sequence)
+        :param hist_out: (n_sequences, 64) int64 output codon histograms
+        """
+        for s in prange(offsets.shape[0] - 1):
+            start = offsets[s]
+            end = offsets[s + 1]
+            n = end - start
+            full = n - n % 3
+            gc = 0
+            for i in range(start, start + full, 3):
+                c0 = _BYTE_CODE[raw[i]]
+                c1 = _BYTE_CODE[raw[i + 1]]
+                c2 = _BYTE_CODE[raw[i + 2]]
+                hist_out[s, (c0 << 4) | (c1 << 2) | c2] += 1
+                gc += (c0 == 1) + (c0 == 2) + (c1 == 1) + (c1 == 2) + (c2 == 1) + (c2 == 2)
+            for i in range(start + full, end):
+                c = _BYTE_CODE[raw[i]]
+                gc += (c == 1) + (c == 2)
+            gc_out[s] = gc
+
+    # Warm-compile at import so the first ETL run isn't charged JIT latency
+    scan_encoded(np.zeros(3, dtype=np.uint8))
+    scan_batch(np.zeros(3, dtype=np.uint8), np.array([0, 3], dtype=np.int64),
+               np.zeros(1, dtype=np.int64), np.zeros((1, 64), dtype=np.int64))
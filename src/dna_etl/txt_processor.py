@@ -1,7 +1,53 @@
-from typing import List, Dict, Any, Union
+from array import array
+from typing import List, Dict, Any, Tuple, Union
 from collections import Counter
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional; pure-Python fallbacks are used without it
+    _NUMPY_AVAILABLE = False
+
+from .per_sequence_numba import _NUMBA_AVAILABLE
+if _NUMBA_AVAILABLE:
+    from .per_sequence_numba import scan_encoded, scan_batch
 # ALL FUNCTIONS WORKING ON LIST OF STR (THAT WAS PARSED FROM TXT)
 
+# Codon index encoding: A=0, C=1, G=2, T=3, two bits per base,
+# so a codon maps to a 6-bit index and its string form is:
+_CODON_STRS = ["ACGT"[i >> 4 & 3] + "ACGT"[i >> 2 & 3] + "ACGT"[i & 3] for i in range(64)]
+# Same 64 codons, but ordered by the dependency-free ASCII hash used in the
+# codons_freq fallback: (byte >> 1) & 3 maps A->0, C->1, T->2, G->3.
+_ASCII_CODON_STRS = ["ACTG"[i >> 4 & 3] + "ACTG"[i >> 2 & 3] + "ACTG"[i & 3] for i in range(64)]
+
+if _NUMPY_AVAILABLE:
+    # byte value -> 2-bit base code lookup table
+    _BASE_LUT = np.zeros(256, dtype=np.uint8)
+    _BASE_LUT[[ord("A"), ord("C"), ord("G"), ord("T")]] = [0, 1, 2, 3]
+
+
+# Below this length the SWAR bit trick beats NumPy's per-call overhead
+_GC_NUMPY_MIN_LEN = 4096
+
+
+def _gc_count_swar(seq_bytes: bytes) -> int:
+    """
+    Bit-parallel GC count with no dependencies: among A/C/G/T only 'C'
+    (0x43) and 'G' (0x47) have ASCII bit 1 set, so masking every byte with
+    0x02 and popcounting the whole buffer as one big integer counts G+C.
+    :param seq_bytes: ASCII-encoded A/C/G/T sequence
+    :return: Number of G/C bases
+    """
+    mask = int.from_bytes(b"\x02" * len(seq_bytes), "little")
+    return (int.from_bytes(seq_bytes, "little") & mask).bit_count()
+
+
+def _is_acgt(seq_bytes: bytes) -> bool:
+    """True if the buffer contains nothing but uppercase A/C/G/T."""
+    # translate with a deletion table is a single C pass; an empty result
+    # means every byte belonged to the alphabet
+    return not seq_bytes.translate(None, b"ACGT")
+
 
 def gc_content(sequence: str) -> float:
     """
@@ -10,9 +56,21 @@ def gc_content(sequence: str) -> float:
     :param sequence: DNA sequence string
     :return: GC content percentage float
     """
-    seq = sequence.strip()
-    gc = seq.count("G") + seq.count("C")
-    return round(gc * 100.0 / len(seq), 2)
+    # extract_txt_sequences already strips lines; only re-strip when needed
+    if sequence and (sequence[0].isspace() or sequence[-1].isspace()):
+        sequence = sequence.strip()
+    data = sequence.encode("ascii")
+    if _NUMPY_AVAILABLE and len(data) >= _GC_NUMPY_MIN_LEN:
+        # One vectorized scan over the raw bytes instead of two str.count passes
+        arr = np.frombuffer(data, dtype=np.uint8)
+        gc = int(np.count_nonzero((arr == 0x47) | (arr == 0x43)))  # 'G' | 'C'
+    elif _is_acgt(data):
+        gc = _gc_count_swar(data)
+    else:
+        # Out-of-alphabet bytes (e.g. 'N', lowercase) can also carry ASCII
+        # bit 1, which the SWAR mask would miscount as G/C — count exactly
+        gc = data.count(b"G") + data.count(b"C")
+    return round(gc * 100.0 / len(sequence), 2)
 
 
 def codons_freq(sequence: str) -> Dict[str, int]:
@@ -23,16 +81,77 @@ def codons_freq(sequence: str) -> Dict[str, int]:
     :return: Dict mapping codons to their counts
     """
     length = len(sequence) - (len(sequence) % 3)  # ignore incomplete codon
-    # Build list of triplets
-    codon_list: List[str] = []
-    i = 0
-    while i < length:
-        triplet = sequence[i:i+3]   # three-letter codon
-        codon_list.append(triplet)
-        i += 3
-    # Count frequencies of each codon
-    counts = Counter(codon_list)
-    return dict(counts)
+    buf = sequence.encode("ascii")
+    if not _is_acgt(buf):
+        # Out-of-alphabet bytes (e.g. 'N') have no 2-bit code — both fast
+        # paths would silently rename such codons to A-containing ones.
+        # Count the literal triplets instead so they survive verbatim.
+        return dict(Counter(sequence[i:i + 3] for i in range(0, length, 3)))
+    if _NUMPY_AVAILABLE:
+        # Encode bases to 2 bits, pack each triplet into a 6-bit codon index
+        # and histogram the indexes into 64 fixed buckets — all in C.
+        b = np.frombuffer(buf, dtype=np.uint8)
+        codes = _BASE_LUT[b[:length]].reshape(-1, 3)
+        idx = (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
+        hist = np.bincount(idx, minlength=64)
+        return {_CODON_STRS[i]: int(hist[i]) for i in np.flatnonzero(hist)}
+
+    # Fallback: count 6-bit codon indexes into a flat 64-slot array. Bits
+    # 1-2 of the ASCII codes are unique across A/C/G/T, so (byte >> 1) & 3
+    # is a perfect 2-bit hash with no lookup table, and bumping array slots
+    # keeps the hot loop free of string slicing and dict hashing.
+    counts = array("I", bytes(4 * 64))
+    for i in range(0, length, 3):
+        counts[((buf[i] >> 1) & 3) << 4
+               | ((buf[i + 1] >> 1) & 3) << 2
+               | ((buf[i + 2] >> 1) & 3)] += 1
+    return {_ASCII_CODON_STRS[i]: c for i, c in enumerate(counts) if c}
+
+
+class PerSequenceResults(List[Dict[str, Any]]):
+    """
+    The per-sequence dict list returned by calculate_per_sequence, plus the
+    raw structure-of-arrays form it was computed from: gc_counts (int64[n])
+    and codon_counts ((n, 64) int64). Aggregations like most_common_codon
+    use the arrays directly instead of re-hashing the dicts.
+    """
+    gc_counts = None
+    codon_counts = None
+
+
+def _count_batch(sequences_lst: List[str]) -> Tuple[Any, Any]:
+    """
+    Compute GC counts and codon histograms for a batch of sequences as
+    arrays: (gc_counts int64[n], codon_counts (n, 64) int64).
+    Uses the parallel numba kernel when available, else vectorized NumPy.
+    """
+    n_seq = len(sequences_lst)
+    if _NUMBA_AVAILABLE:
+        # Pack the raw bytes into a single flat buffer (the kernel encodes
+        # inline) so the batch kernel can parallelize across cores.
+        offsets = np.zeros(n_seq + 1, dtype=np.int64)
+        for k, seq in enumerate(sequences_lst):
+            offsets[k + 1] = offsets[k] + len(seq)
+        buf = np.empty(offsets[-1], dtype=np.uint8)
+        for k, seq in enumerate(sequences_lst):
+            buf[offsets[k]:offsets[k + 1]] = np.frombuffer(
+                seq.encode("ascii"), dtype=np.uint8)
+
+        gc_out = np.zeros(n_seq, dtype=np.int64)
+        hist_out = np.zeros((n_seq, 64), dtype=np.int64)
+        scan_batch(buf, offsets, gc_out, hist_out)
+        return gc_out, hist_out
+
+    gc_out = np.empty(n_seq, dtype=np.int64)
+    hist_out = np.zeros((n_seq, 64), dtype=np.int64)
+    for k, seq in enumerate(sequences_lst):
+        codes = _BASE_LUT[np.frombuffer(seq.encode("ascii"), dtype=np.uint8)]
+        gc_out[k] = ((codes == 1) | (codes == 2)).sum()  # C or G
+        full = codes.size - codes.size % 3
+        triplets = codes[:full].reshape(-1, 3)
+        idx = (triplets[:, 0] << 4) | (triplets[:, 1] << 2) | triplets[:, 2]
+        hist_out[k] = np.bincount(idx, minlength=64)
+    return gc_out, hist_out
 
 
 def calculate_per_sequence(sequences_lst: List[str]) -> List[Dict[str, Any]]:
@@ -40,15 +159,34 @@ def calculate_per_sequence(sequences_lst: List[str]) -> List[Dict[str, Any]]:
     For each sequence, compute GC% and codon frequency.
     Returns a list like:
       [{"gc_content": <float>, "codons": {<codon>: <count>, ...}}, ...]
+    (a PerSequenceResults carrying the raw count arrays on the fast path).
     :param sequences_lst: List of DNA sequence strings
     :return: List of dictionaries with GC content and codon frequencies
     """
-    results: List[Dict[str, Any]] = []
+    # The batch kernels encode bases to 2 bits, which only exists for
+    # A/C/G/T; a batch with any other byte takes the exact per-sequence
+    # path below, where codons_freq keeps out-of-alphabet triplets verbatim.
+    if (_NUMPY_AVAILABLE and sequences_lst
+            and all(_is_acgt(s.encode("ascii")) for s in sequences_lst)):
+        gc_counts, codon_counts = _count_batch(sequences_lst)
+
+        # Cheap Python post-pass: rehydrate codon dicts from the histograms
+        results = PerSequenceResults()
+        results.gc_counts = gc_counts
+        results.codon_counts = codon_counts
+        for k, seq in enumerate(sequences_lst):
+            gc = round(int(gc_counts[k]) * 100.0 / len(seq), 2)
+            row = codon_counts[k]
+            codons = {_CODON_STRS[i]: int(row[i]) for i in np.flatnonzero(row)}
+            results.append({"gc_content": gc, "codons": codons})
+        return results
+
+    results_plain: List[Dict[str, Any]] = []
     for seq in sequences_lst:
         gc = gc_content(seq)          # float
         codons = codons_freq(seq)     # Dict[str, int]
-        results.append({"gc_content": gc, "codons": codons})
-    return results
+        results_plain.append({"gc_content": gc, "codons": codons})
+    return results_plain
 
 
 def most_common_codon(per_seq_info_lst: List[Dict[str, Any]]) -> str:
@@ -58,6 +196,18 @@ def most_common_codon(per_seq_info_lst: List[Dict[str, Any]]) -> str:
     :param per_seq_info_lst: List of per-sequence info dicts
     :return: Most common codon(s) as a space-separated string
     """
+    # Fast path: the SoA histogram matrix from calculate_per_sequence sums
+    # and maxes in C, with no dict hashing.
+    counts = getattr(per_seq_info_lst, "codon_counts", None)
+    if counts is not None:
+        totals = counts.sum(axis=0)
+        max_count = int(totals.max()) if totals.size else 0
+        if max_count == 0:
+            return ""
+        # base codes ascend A<C<G<T, so ascending codon indexes are already
+        # in lexicographic order — no sort needed
+        return " ".join(_CODON_STRS[i] for i in np.flatnonzero(totals == max_count))
+
     # Merge all per-sequence codon histograms into one counter
     total = Counter()
     for entry in per_seq_info_lst:
@@ -65,89 +215,235 @@ def most_common_codon(per_seq_info_lst: List[Dict[str, Any]]) -> str:
         # {"gc_content": <float>, "codons": {<codon>: <count>, ...}}
         total.update(entry["codons"])  # adds each codon count into the total
 
-    max_count = -1
-    winners: List[str] = []
-    for codon, cnt in total.items():
-        if cnt > max_count:
-            max_count = cnt
-            winners = [codon]
-        elif cnt == max_count:
-            winners.append(codon)
-
-    winners.sort()  # deterministic order
+    if not total:
+        return ""
+    # most_common(1) finds the max count in C; one short scan picks ties
+    max_count = total.most_common(1)[0][1]
+    winners = sorted(codon for codon, cnt in total.items() if cnt == max_count)
     return " ".join(winners)
 
 
-def lcs_two_strings(m: str, n: str) -> (str, int):
-    str1 = list(m)
-    str2 = list(n)
+def _build_generalized_sam(sequences_lst: List[str]) -> Dict[str, Any]:
+    """
+    Build a generalized suffix automaton over all sequences.
+    Every substring of every sequence corresponds to exactly one state;
+    state v represents substrings of lengths (len[link[v]], len[v]].
+    State data is stored structure-of-arrays: lengths and links in
+    array.array columns, and all transitions in one flat array indexed by
+    state * sigma + char_code — no per-state dict allocations.
+    :param sequences_lst: List of DNA sequence strings
+    :return: Dict with "len", "link", "trans" arrays plus the "code" char
+             map and "sigma" alphabet size used to index "trans"
+    """
+    # Assign integer codes to the alphabet up front so transitions can
+    # live in a single flat row-per-state table.
+    code: Dict[str, int] = {}
+    for seq in sequences_lst:
+        for ch in seq:
+            if ch not in code:
+                code[ch] = len(code)
+    sigma = len(code) or 1
+
+    sa_len = array("q", [0])
+    sa_link = array("q", [-1])
+    trans = array("q", [-1] * sigma)
+    no_trans = array("q", [-1] * sigma)
 
-    # Create a 2D array to store lengths of longest common subsequence.
-    dp = [[0] * (len(str2) + 1) for _ in range(len(str1) + 1)]
+    def _new_state(length: int, link: int, copy_from: int = -1) -> int:
+        sa_len.append(length)
+        sa_link.append(link)
+        if copy_from == -1:
+            trans.extend(no_trans)
+        else:
+            trans.extend(trans[copy_from * sigma:(copy_from + 1) * sigma])
+        return len(sa_len) - 1
 
-    max_length = 0
-    end_i = 0  # end index of LCS in str1
+    def _extend(last: int, c: int) -> int:
+        # Generalized construction: the transition may already exist
+        # because an earlier sequence inserted the same substring.
+        q = trans[last * sigma + c]
+        if q != -1:
+            if sa_len[q] == sa_len[last] + 1:
+                return q
+            # Split q so that a state of length len(last)+1 exists
+            clone = _new_state(sa_len[last] + 1, sa_link[q], copy_from=q)
+            p = last
+            while p != -1 and trans[p * sigma + c] == q:
+                trans[p * sigma + c] = clone
+                p = sa_link[p]
+            sa_link[q] = clone
+            return clone
 
-    # Iterate over each position in the matrix
-    for i in range(1, len(str1) + 1):
-        for j in range(1, len(str2) + 1):
+        cur = _new_state(sa_len[last] + 1, 0)
+        p = last
+        while p != -1 and trans[p * sigma + c] == -1:
+            trans[p * sigma + c] = cur
+            p = sa_link[p]
+        if p != -1:
+            q = trans[p * sigma + c]
+            if sa_len[p] + 1 == sa_len[q]:
+                sa_link[cur] = q
+            else:
+                clone = _new_state(sa_len[p] + 1, sa_link[q], copy_from=q)
+                while p != -1 and trans[p * sigma + c] == q:
+                    trans[p * sigma + c] = clone
+                    p = sa_link[p]
+                sa_link[q] = clone
+                sa_link[cur] = clone
+        return cur
 
-            # If characters are equal
-            if str1[i - 1] == str2[j - 1]:
-                # Get the number from diagonally opposite
-                # and add 1
-                dp[i][j] = dp[i - 1][j - 1] + 1
+    for seq in sequences_lst:
+        last = 0
+        for ch in seq:
+            last = _extend(last, code[ch])
 
-                if dp[i][j] > max_length:
-                    max_length = dp[i][j]
-                    end_i = i
-    value = m[end_i - max_length:end_i]
+    return {"len": sa_len, "link": sa_link, "trans": trans, "code": code, "sigma": sigma}
 
-    return value, max_length
+
+def lcs_two_strings(m: str, n: str) -> Tuple[str, int]:
+    """
+    Longest common substring of two strings in O(|m| + |n|):
+    build a suffix automaton over n and stream m through it, tracking the
+    current match length. No DP matrix is allocated; ties are broken by the
+    earliest end position in m (as the row-major DP used to).
+    :param m: First string (the reported value is a slice of this one)
+    :param n: Second string
+    :return: (longest common substring, its length)
+    """
+    if not m or not n:
+        return "", 0
+    sam = _build_generalized_sam([n])
+    sa_len, sa_link, trans = sam["len"], sam["link"], sam["trans"]
+    code, sigma = sam["code"], sam["sigma"]
+
+    v = 0
+    length = 0
+    best_len = 0
+    best_end = 0
+    for i, ch in enumerate(m):
+        c = code.get(ch, -1)
+        if c == -1:  # character never occurs in n
+            v = 0
+            length = 0
+            continue
+        # Follow suffix links until a state with a transition on c is found
+        while v and trans[v * sigma + c] == -1:
+            v = sa_link[v]
+            length = sa_len[v]
+        nxt = trans[v * sigma + c]
+        if nxt != -1:
+            v = nxt
+            length += 1
+        else:
+            v = 0
+            length = 0
+        if length > best_len:
+            best_len = length
+            best_end = i + 1
+
+    return m[best_end - best_len:best_end], best_len
 
 
 def lcs(sequences_lst: List[str]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
     """
     finds the longest common string between two DNA sequences- a single longest
-    subsequence that appears in two (or more) sequences.
+    substring that appears in two (or more) sequences.
+    Uses one generalized suffix automaton over all sequences, so the whole
+    search is O(total length) instead of a quadratic pairwise DP.
     :param sequences_lst: List of DNA sequence strings
-    :return: A tuple containing the longest common subsequence string,
-                its length, and a list of the indexes of the sequences in which it appears
+    :return: A dict (or list of dicts on ties) containing the longest common
+                substring, its length, and the 1-based indexes of the sequences
+                in which it appears
     """
     n = len(sequences_lst)
+    if n < 2:
+        return []
+
+    sam = _build_generalized_sam(sequences_lst)
+    sa_len, sa_link, trans = sam["len"], sam["link"], sam["trans"]
+    code, sigma = sam["code"], sam["sigma"]
+    n_states = len(sa_len)
+
+    # For each state: bitmask of the sequences containing its substrings,
+    # plus one sample occurrence (seq index, end position) for reconstruction.
+    masks = [0] * n_states
+    occ: List[Any] = [None] * n_states
+    for k, seq in enumerate(sequences_lst):
+        bit = 1 << k
+        cur = 0
+        for i, ch in enumerate(seq):
+            cur = trans[cur * sigma + code[ch]]
+            masks[cur] |= bit
+            if occ[cur] is None:
+                occ[cur] = (k, i + 1)
+
+    # Propagate masks/occurrences up the suffix links (shorter suffixes
+    # occur wherever their extensions do): process states longest-first.
+    # State lengths are bounded by the longest sequence, so a counting
+    # sort yields the topological order in O(states + max_len).
+    max_state_len = max(sa_len)
+    pos = [0] * (max_state_len + 1)
+    for v in range(1, n_states):
+        pos[sa_len[v]] += 1
+    total = 0
+    for length in range(max_state_len, 0, -1):  # longest first
+        pos[length], total = total, total + pos[length]
+    order = [0] * (n_states - 1)
+    for v in range(1, n_states):
+        length = sa_len[v]
+        order[pos[length]] = v
+        pos[length] += 1
+    for v in order:
+        parent = sa_link[v]
+        if parent > 0:
+            masks[parent] |= masks[v]
+            if occ[parent] is None:
+                occ[parent] = occ[v]
+
+    # Longest state shared by at least two sequences wins
     best_len = 0
+    for v in range(1, n_states):
+        if sa_len[v] > best_len and masks[v].bit_count() >= 2:
+            best_len = sa_len[v]
+    if best_len == 0:
+        return []
+
+    # Collect all best-length substrings (ties) with the sequences containing them
+    candidates: Dict[str, int] = {}
+    for v in range(1, n_states):
+        if sa_len[v] == best_len and masks[v].bit_count() >= 2:
+            k, end = occ[v]
+            value = sequences_lst[k][end - best_len:end]
+            candidates[value] = candidates.get(value, 0) | masks[v]
 
-    # Keep winners in first-seen order without duplicates
+    # Each qualifying pair reports the candidate ending earliest in its first
+    # sequence (same tie-break as the row-major pairwise DP this replaces).
+    # Memoize the earliest end per (candidate, sequence) so the substring
+    # search runs once per combination, not once per pair.
+    # Keep winners in first-seen pair order without duplicates.
+    first_end: Dict[Tuple[str, int], int] = {}
     winners_lst: List[str] = []
     seen_values: set[str] = set()
-
     for i in range(n):
-        s1 = sequences_lst[i]
         for j in range(i + 1, n):
-            s2 = sequences_lst[j]
-            value, length = lcs_two_strings(s1, s2)  # returns (substring, length)
-
-            if length == 0:
-                continue
-
-            if length > best_len:
-                # New best found → reset the winners to only this value
-                best_len = length
-                winners_lst = []
-                seen_values.clear()
-                winners_lst.append(value)
-                seen_values.add(value)
-
-            elif length == best_len:
-                # Same best length → include this value if not already included
-                if value not in seen_values:
-                    winners_lst.append(value)
-                    seen_values.add(value)
-
-    # Build output records: for each winning substring, collect ALL sequences (1-based) containing it
+            best_val = None
+            best_end = -1
+            for val, mask in candidates.items():
+                if mask >> i & 1 and mask >> j & 1:
+                    end = first_end.get((val, i))
+                    if end is None:
+                        end = sequences_lst[i].find(val) + best_len
+                        first_end[(val, i)] = end
+                    if best_val is None or end < best_end:
+                        best_val, best_end = val, end
+            if best_val is not None and best_val not in seen_values:
+                winners_lst.append(best_val)
+                seen_values.add(best_val)
+
     results: List[Dict[str, Any]] = []
     for val in winners_lst:
-        indices = [idx + 1 for idx, s in enumerate(sequences_lst) if val in s]
+        mask = candidates[val]
+        indices = [idx + 1 for idx in range(n) if mask >> idx & 1]
         results.append({"value": val, "sequences": indices, "length": best_len})
 
     # If only one winner → return a single dict; otherwise return a list of dicts
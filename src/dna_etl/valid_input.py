@@ -1,15 +1,114 @@
+import os
+import stat
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Union
 ALLOWED_EXTENSIONS = {".json", ".txt"}
 ALLOWED_KEY_SETS = [{"context_path", "results_path"}]
 
 
-def valid_input_format(input_data: Dict[str, Any]) -> bool:
+@lru_cache(maxsize=None)
+def _list_context(context_path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], int]:
+    """
+    Classify the files in the context directory in one os.scandir pass.
+    DirEntry.is_file reads the cached dirent type (symlinks are followed,
+    matching both the baseline Path.is_file and ETL._find_pair), and the
+    result is cached per path string so the validators below share a
+    single directory walk.
+    :param context_path: Context directory as a string
+    :return: (json filenames, txt filenames, count of other files)
+    """
+    jsons: List[str] = []
+    txts: List[str] = []
+    other = 0
+    with os.scandir(context_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            lower = entry.name.lower()
+            if lower.endswith(".json"):
+                jsons.append(entry.name)
+            elif lower.endswith(".txt"):
+                txts.append(entry.name)
+            else:
+                other += 1
+    return tuple(jsons), tuple(txts), other
+
+
+@dataclass(frozen=True)
+class ValidatedPaths:
+    """
+    Runner input normalized once by preflight: resolved paths plus the
+    answers of every stat/scandir the valid_* checks would otherwise make.
+    """
+    context: Path
+    results: Path
+    format_ok: bool
+    context_is_dir: bool
+    results_exists: bool
+    results_is_dir: bool
+    results_parent_is_dir: bool
+    jsons: Tuple[str, ...]
+    txts: Tuple[str, ...]
+    other: int
+
+
+# Every valid_* check accepts either the raw runner dict or a preflighted struct
+InputData = Union[Dict[str, Any], ValidatedPaths]
+
+
+def preflight(input_data: Dict[str, Any]) -> ValidatedPaths:
+    """
+    Resolve both paths and take their stats exactly once, so running the
+    five valid_* checks on the result costs zero syscalls each. Per call
+    the saving is small, but it adds up when a batch run validates
+    thousands of manifests.
+    :param input_data: Parsed runner input dict
+    :return: Frozen snapshot the valid_* functions accept in place of the dict
+    """
+    format_ok = valid_input_format(input_data)
+    cp = input_data.get("context_path") if isinstance(input_data, dict) else None
+    rp = (input_data.get("results_path", input_data.get("result_path"))
+          if isinstance(input_data, dict) else None)
+    has_cp = isinstance(cp, str) and bool(cp.strip())
+    has_rp = isinstance(rp, str) and bool(rp.strip())
+
+    context = Path(cp).resolve() if has_cp else Path()
+    results = Path(rp).resolve() if has_rp else Path()
+
+    context_is_dir = has_cp and _is_dir(str(context))
+    results_exists = False
+    results_is_dir = False
+    results_parent_is_dir = False
+    if has_rp:
+        try:
+            st = os.stat(results)
+            results_exists = True
+            results_is_dir = stat.S_ISDIR(st.st_mode)
+        except OSError:
+            results_parent_is_dir = _is_dir(str(results.parent))
+
+    if context_is_dir:
+        jsons, txts, other = _list_context(str(context))
+    else:
+        jsons, txts, other = (), (), 0
+
+    return ValidatedPaths(context=context, results=results, format_ok=format_ok,
+                          context_is_dir=context_is_dir, results_exists=results_exists,
+                          results_is_dir=results_is_dir,
+                          results_parent_is_dir=results_parent_is_dir,
+                          jsons=jsons, txts=txts, other=other)
+
+
+def valid_input_format(input_data: InputData) -> bool:
     """
     Validate input.json has exactly two fields and both are non-empty strings:
       - context_path
       - results_path (or result_path)
     """
+    if isinstance(input_data, ValidatedPaths):
+        return input_data.format_ok
     if not isinstance(input_data, dict):
         return False
 
@@ -31,62 +130,66 @@ def valid_input_format(input_data: Dict[str, Any]) -> bool:
     return True
 
 
-def valid_context_path(input_data: Dict[str, Any]) -> bool:
+def _is_dir(path: str) -> bool:
+    """One os.stat instead of the exists() + is_dir() double stat."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
+
+
+def valid_context_path(input_data: InputData) -> bool:
     """
     'context_path' must be an existing directory.
     """
-    p = Path(input_data["context_path"])
-    return p.exists() and p.is_dir()
+    if isinstance(input_data, ValidatedPaths):
+        return input_data.context_is_dir
+    return _is_dir(input_data["context_path"])
 
 
-def valid_results_path(input_data: Dict[str, Any]) -> bool:
+def valid_results_path(input_data: InputData) -> bool:
     """
     Ensure the results_path points to a directory we can write into.
-    :param input_data: Dict with 'results_path'/'result_path'
+    :param input_data: Dict with 'results_path'/'result_path', or a preflighted struct
     :return: True if path is an existing directory OR a creatable directory (parent exists)
     """
+    if isinstance(input_data, ValidatedPaths):
+        return (input_data.results_is_dir if input_data.results_exists
+                else input_data.results_parent_is_dir)
     p = Path(input_data["results_path"])
-
-    if p.exists():
-        return p.is_dir()  # p must be a directory
-
-    # path doesn't exist yet -> parent directory must exist
-    return p.parent.exists() and p.parent.is_dir()
+    try:
+        st = os.stat(p)
+    except OSError:
+        # path doesn't exist yet -> parent directory must exist
+        return _is_dir(str(p.parent))
+    return stat.S_ISDIR(st.st_mode)  # p must be a directory
 
 
-def valid_context_files(input_data: Dict[str, Any]) -> bool:
+def valid_context_files(input_data: InputData) -> bool:
     """
     Ensure the context directory contains exactly two files,
     and all files present are .json or .txt.
     """
-    p = Path(input_data["context_path"])
-    files: List[Path] = [f for f in p.iterdir() if f.is_file()]
-    if len(files) != 2:
-        return False
-
-    # All files must be allowed extensions
-    if any(f.suffix.lower() not in ALLOWED_EXTENSIONS for f in files):
-        return False
+    if isinstance(input_data, ValidatedPaths):
+        jsons, txts, other = input_data.jsons, input_data.txts, input_data.other
+    else:
+        jsons, txts, other = _list_context(input_data["context_path"])
+    # Exactly two files: one .json and one .txt, nothing else
+    return len(jsons) == 1 and len(txts) == 1 and other == 0
 
-    # Must be one .json and one .txt
-    extensions = {f.suffix.lower() for f in files}
-    return extensions == {".json", ".txt"}
 
-
-def valid_file_names(input_data: Dict[str, Any]) -> bool:
+def valid_file_names(input_data: InputData) -> bool:
     """
     Ensure the two files share the same base filename (same participant id),
     and that there is exactly one .json and one .txt.
     """
-    p = Path(input_data["context_path"])
-    # Get all files in the directory
-    files: List[Path] = [f for f in p.iterdir() if f.is_file()]
-    if len(files) != 2:
-        return False
+    if isinstance(input_data, ValidatedPaths):
+        jsons, txts, other = input_data.jsons, input_data.txts, input_data.other
+    else:
+        jsons, txts, other = _list_context(input_data["context_path"])
     # Exactly one .json and one .txt
-    jsons = [f for f in files if f.suffix.lower() == ".json"]
-    txts = [f for f in files if f.suffix.lower() == ".txt"]
-    if len(jsons) != 1 or len(txts) != 1:
+    if len(jsons) != 1 or len(txts) != 1 or other != 0:
         return False
     # Same stem for both (e.g., "IND123456_dna.json" & "IND123456_dna.txt")
-    return jsons[0].stem == txts[0].stem
+    return jsons[0][:-5] == txts[0][:-4]
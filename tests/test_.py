@@ -10,6 +10,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 # --- Imports from the package under test ---
 from dna_etl.valid_input import (
+    preflight,
     valid_input_format,
     valid_context_path,
     valid_results_path,
@@ -30,13 +31,17 @@ from dna_etl.json_processor import (
     dates_valid,
     values_length_valid,
     remove_sensitive_data,
+    process_metadata,
 )
 from dna_etl.ETL import (
     extract_json_data,
     open_input_file,              # (context_path, json_path, txt_path, results_path, participant_id)
     build_results_block,
     build_final_output,
+    process_one,
+    run_batch,
 )
+from dna_etl.batch_reader import read_many
 
 # write_output
 write_output = pytest.importorskip("dna_etl.ETL", reason="write_output not found").write_output
@@ -186,6 +191,45 @@ def test_valid_file_names_reject_mismatch(tmp_path: Path):
     assert valid_file_names(in_data) is False
 
 
+def test_preflight_matches_dict_validators(tmp_path: Path):
+    ctx = tmp_path / "ctx"
+    write_context_pair(ctx, "IND123456_dna", make_sample_metadata(), ["ATCG"])
+    checks = (valid_input_format, valid_context_path, valid_results_path,
+              valid_context_files, valid_file_names)
+
+    good = {"context_path": str(ctx), "results_path": str(tmp_path / "out")}
+    vp = preflight(good)
+    for check in checks:
+        assert check(vp) == check(good)
+
+    # later checks are only defined once the earlier ones pass (the dict
+    # path, like baseline, raises on a missing key or directory), so the
+    # degraded inputs compare the checks that are defined for them — and
+    # the preflighted struct must answer all five without raising
+    bad_ctx = {"context_path": str(tmp_path / "missing"), "results_path": str(tmp_path / "out")}
+    vp = preflight(bad_ctx)
+    for check in (valid_input_format, valid_context_path, valid_results_path):
+        assert check(vp) == check(bad_ctx)
+    assert valid_context_path(vp) is False
+    assert valid_context_files(vp) is False and valid_file_names(vp) is False
+
+    bad_format = {"context_path": str(ctx)}  # missing results_path
+    vp = preflight(bad_format)
+    assert valid_input_format(vp) == valid_input_format(bad_format) is False
+    assert all(check(vp) in (True, False) for check in checks)
+
+
+def test_preflight_good_input_passes_every_check(tmp_path: Path):
+    ctx = tmp_path / "ctx"
+    write_context_pair(ctx, "IND123456_dna", make_sample_metadata(), ["ATCG"])
+    vp = preflight({"context_path": str(ctx), "results_path": str(tmp_path / "out")})
+    assert valid_input_format(vp) is True
+    assert valid_context_path(vp) is True
+    assert valid_results_path(vp) is True
+    assert valid_context_files(vp) is True
+    assert valid_file_names(vp) is True
+
+
 # ------------------------------
 # json_processor.py tests
 # ------------------------------
@@ -225,6 +269,27 @@ def test_remove_sensitive_data_strips_leading_underscore_keys():
     assert "_internal_flag" not in cleaned.get("individual_metadata", {})
 
 
+def test_process_metadata_ok_strips_and_validates():
+    meta = make_sample_metadata()
+    cleaned, ok, err = process_metadata(meta)
+    assert ok is True and err == ""
+    assert "_id" not in cleaned["individual_metadata"]
+    assert "_internal_flag" not in cleaned["individual_metadata"]
+    assert cleaned["test_metadata"]["test_id"] == "DNA123456"
+
+
+def test_process_metadata_rejects_out_of_range_dates():
+    _, ok, err = process_metadata(make_sample_metadata(valid_dates=False))
+    assert ok is False
+    assert "date" in err
+
+
+def test_process_metadata_rejects_long_strings():
+    _, ok, err = process_metadata(make_sample_metadata(long_string=True))
+    assert ok is False
+    assert "64" in err
+
+
 # ------------------------------
 # txt_processor.py tests
 # ------------------------------
@@ -236,6 +301,27 @@ def test_gc_content_and_codons_freq_basic():
     assert cf == {"ATC": 1, "GAT": 1}
 
 
+def test_gc_content_counts_only_gc_bytes():
+    # out-of-alphabet bytes must never count as G/C, at any length
+    assert gc_content("NNNN") == 0.0
+    assert gc_content("ACGN") == 50.0
+    assert gc_content("gcgc") == 0.0
+    assert gc_content("N" * 5000) == 0.0
+    assert gc_content("GC" * 3000) == 100.0
+
+
+def test_codons_freq_preserves_out_of_alphabet_codons():
+    assert codons_freq("ANTGGG") == {"ANT": 1, "GGG": 1}
+    assert codons_freq("NNN") == {"NNN": 1}
+
+
+def test_calculate_per_sequence_preserves_out_of_alphabet_codons():
+    per_seq = calculate_per_sequence(["ANTGGG", "ATCGCC"])
+    assert per_seq[0]["codons"] == {"ANT": 1, "GGG": 1}
+    assert pytest.approx(per_seq[0]["gc_content"], abs=0.01) == 50.0
+    assert per_seq[1]["codons"] == {"ATC": 1, "GCC": 1}
+
+
 def test_calculate_per_sequence_and_most_common_codon_and_lcs(tmp_path: Path):
     seqs = [
         "ATCGATCGTAGCTAGCTAGCTGATCGATCGAT",
@@ -268,6 +354,13 @@ def test_lcs_tie_returns_all_winners():
         assert all(isinstance(x, int) and x >= 1 for x in d["sequences"])
 
 
+def test_lcs_pair_tie_breaks_on_earliest_match_in_first_sequence():
+    # "AAA" and "CCC" are both common with length 3; the match ending
+    # earliest in the pair's first sequence wins
+    out = lcs(["TTTAAACCC", "AAAGCCC"])
+    assert out == {"value": "AAA", "sequences": [1, 2], "length": 3}
+
+
 def test_build_txt_output_shape():
     per_seq = [{"gc_content": 50.0, "codons": {"ATC": 1}}]
     most = "ATC"
@@ -338,3 +431,60 @@ def test_write_output_overwrites(tmp_path: Path):
     p2 = write_output(out_dir, participant_id, data_v2)
     assert p2 == p1
     assert json.loads(p2.read_text(encoding="utf-8")) == data_v2
+
+
+# ------------------------------
+# Batch driver tests
+# ------------------------------
+
+def make_participant(tmp_path: Path, stem: str, manifest_name: str) -> Path:
+    """Create a context dir + manifest for one participant; return the manifest path."""
+    ctx = tmp_path / f"ctx_{stem}"
+    write_context_pair(ctx, f"{stem}_dna", make_sample_metadata(),
+                       ["ATCGATCGTAGCTAGCTAGCTGATCGATCGAT", "ATCGGTAAATGCCTGAAAGATG"])
+    return make_input_json(tmp_path / manifest_name, ctx, tmp_path / "out")
+
+
+def test_read_many_preserves_order(tmp_path: Path):
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"f{i}.bin"
+        p.write_bytes(f"payload-{i}".encode())
+        paths.append(p)
+    assert read_many(paths) == [f"payload-{i}".encode() for i in range(3)]
+
+
+def test_process_one_writes_full_output(tmp_path: Path):
+    manifest = make_participant(tmp_path, "IND123456", "input.json")
+    out_path = process_one(str(manifest))
+    data = json.loads(out_path.read_text(encoding="utf-8"))
+    assert data.keys() == {"metadata", "results"}
+    assert data["results"][0]["participant"]["_id"] == "IND123456"
+    assert "_internal_flag" not in data["results"][0]["JSON"]["individual_metadata"]
+    assert data["results"][0]["txt"]["lcs"]["value"] == "ATCG"
+
+
+def test_process_one_raises_on_failed_validation(tmp_path: Path):
+    ctx = tmp_path / "ctx"
+    write_context_pair(ctx, "IND123456_dna", make_sample_metadata(valid_dates=False), ["ATCG"])
+    manifest = make_input_json(tmp_path / "input.json", ctx, tmp_path / "out")
+    with pytest.raises(ValueError):
+        process_one(str(manifest))
+
+
+def test_run_batch_processes_each_manifest(tmp_path: Path):
+    manifests = [make_participant(tmp_path, f"IND00000{i}", f"in{i}.json") for i in (1, 2)]
+    outs = run_batch(manifests)
+    assert [p.name for p in outs] == ["IND000001.json", "IND000002.json"]
+    for out_path, stem in zip(outs, ("IND000001", "IND000002")):
+        data = json.loads(out_path.read_text(encoding="utf-8"))
+        assert data["results"][0]["participant"]["_id"] == stem
+
+
+def test_run_batch_rejects_bad_manifest_before_processing(tmp_path: Path):
+    good = make_participant(tmp_path, "IND000001", "in1.json")
+    bad = make_input_json(tmp_path / "bad.json", tmp_path / "missing_ctx", tmp_path / "out")
+    with pytest.raises(ValueError):
+        run_batch([good, bad])
+    # nothing was processed: the bad manifest failed preflight before any worker ran
+    assert not (tmp_path / "out").exists()